@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify, g
 from supabase_client import supabase_admin
 from auth_middleware import admin_required
+from answer_storage import MIN_CLEANUP_AGE_MINUTES, cleanup_unreferenced
 
 admin_bp = Blueprint("admin", __name__, url_prefix="/api/admin")
 
@@ -113,3 +114,27 @@ def delete_exam(exam_id):
         return jsonify({"message": "Exam deleted"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+
+@admin_bp.route("/storage/cleanup", methods=["POST"])
+@admin_required
+def cleanup_storage():
+    """Remove answer files no longer referenced by any answer."""
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            min_age_minutes = int(data.get("min_age_minutes", 60))
+        except (TypeError, ValueError):
+            return jsonify({"error": "min_age_minutes must be an integer"}), 400
+        if min_age_minutes < MIN_CLEANUP_AGE_MINUTES:
+            return jsonify({
+                "error": f"min_age_minutes must be at least {MIN_CLEANUP_AGE_MINUTES}"
+            }), 400
+
+        removed = cleanup_unreferenced(
+            min_age_minutes=min_age_minutes,
+            dry_run=bool(data.get("dry_run", False)),
+        )
+        return jsonify({"message": f"{len(removed)} files removed", "removed": removed}), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,185 @@
+import hashlib
+import mimetypes
+import re
+from datetime import datetime, timedelta, timezone
+from supabase_client import supabase_admin
+from scan_processing import SCAN_KEEP_ORIGINAL, process_scan
+
+# Answer files are stored content-addressed: the object path is the SHA-256
+# of the uploaded bytes, and answers.answer_file_hash points at it.
+# Resubmitting the same scan (e.g. on autosave) therefore never uploads or
+# re-processes the bytes twice. Images are normalised before storage (see
+# scan_processing), with the thumbnail and, optionally, the untouched
+# original kept under the same hash in sibling folders. Object names carry
+# an extension from the stored content type so downloads open correctly.
+
+BUCKET = "exam-files"
+ANSWERS_FOLDER = "answers"
+THUMBNAILS_FOLDER = "answers/thumbnails"
+ORIGINALS_FOLDER = "answers/originals"
+LIST_PAGE_SIZE = 1000
+RECHECK_BATCH_SIZE = 100
+
+# Below this, cleanup could remove an upload whose answer row is still
+# being written.
+MIN_CLEANUP_AGE_MINUTES = 10
+
+_OBJECT_NAME_RE = re.compile(r"^([0-9a-f]{64})(\.[0-9a-z]+)?$")
+
+
+def content_hash(file_bytes):
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def file_extension(content_type):
+    return mimetypes.guess_extension((content_type or "").split(";")[0].strip()) or ""
+
+
+def answer_file_path(file_hash, folder=ANSWERS_FOLDER, content_type=None):
+    return f"{folder}/{file_hash}{file_extension(content_type)}"
+
+
+def find_stored(file_hash):
+    """Return the file fields of an answer already referencing this hash."""
+    result = supabase_admin.table("answers").select(
+        "answer_file_hash, answer_file_url, answer_thumbnail_url"
+    ).eq("answer_file_hash", file_hash).limit(1).execute()
+    return result.data[0] if result.data else None
+
+
+def _upload(bucket, filepath, file_bytes, content_type):
+    # upsert keeps this idempotent if a concurrent request stored it first
+    bucket.upload(filepath, file_bytes, {
+        "content-type": content_type or "application/octet-stream",
+        "upsert": "true",
+    })
+
+
+def store_answer_file(file_bytes, content_type, existing=None):
+    """Process and upload answer bytes unless identical content is stored.
+
+    existing is the answer row being replaced; when it already holds this
+    hash, the common autosave case needs no lookup at all. Returns the
+    answer columns describing the stored file.
+    """
+    file_hash = content_hash(file_bytes)
+    if existing and existing.get("answer_file_hash") == file_hash:
+        stored = existing
+    else:
+        stored = find_stored(file_hash)
+    if stored:
+        return {
+            "answer_file_hash": file_hash,
+            "answer_file_url": stored.get("answer_file_url", ""),
+            "answer_thumbnail_url": stored.get("answer_thumbnail_url", ""),
+        }
+
+    bucket = supabase_admin.storage.from_(BUCKET)
+    scan, scan_type, thumbnail = process_scan(file_bytes, content_type)
+
+    filepath = answer_file_path(file_hash, content_type=scan_type)
+    _upload(bucket, filepath, scan, scan_type)
+
+    thumbnail_url = ""
+    if thumbnail:
+        thumb_path = answer_file_path(file_hash, THUMBNAILS_FOLDER, "image/jpeg")
+        _upload(bucket, thumb_path, thumbnail, "image/jpeg")
+        thumbnail_url = bucket.get_public_url(thumb_path)
+
+    if SCAN_KEEP_ORIGINAL and scan is not file_bytes:
+        _upload(bucket, answer_file_path(file_hash, ORIGINALS_FOLDER, content_type),
+                file_bytes, content_type)
+
+    return {
+        "answer_file_hash": file_hash,
+        "answer_file_url": bucket.get_public_url(filepath),
+        "answer_thumbnail_url": thumbnail_url,
+    }
+
+
+def _list_objects(folder):
+    bucket = supabase_admin.storage.from_(BUCKET)
+    offset = 0
+    while True:
+        page = bucket.list(folder, {"limit": LIST_PAGE_SIZE, "offset": offset})
+        if not page:
+            return
+        yield from page
+        if len(page) < LIST_PAGE_SIZE:
+            return
+        offset += LIST_PAGE_SIZE
+
+
+def _referenced_hashes():
+    # Paged, since PostgREST caps rows per response and a truncated set
+    # would make live objects look orphaned.
+    hashes = set()
+    start = 0
+    while True:
+        result = supabase_admin.table("answers").select("answer_file_hash").neq(
+            "answer_file_hash", ""
+        ).order("id").range(start, start + LIST_PAGE_SIZE - 1).execute()
+        rows = result.data or []
+        hashes.update(row["answer_file_hash"] for row in rows)
+        if len(rows) < LIST_PAGE_SIZE:
+            return hashes
+        start += LIST_PAGE_SIZE
+
+
+def _parse_timestamp(value):
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _still_referenced(file_hashes):
+    referenced = set()
+    for i in range(0, len(file_hashes), RECHECK_BATCH_SIZE):
+        batch = file_hashes[i:i + RECHECK_BATCH_SIZE]
+        result = supabase_admin.table("answers").select("answer_file_hash").in_(
+            "answer_file_hash", batch
+        ).execute()
+        referenced.update(row["answer_file_hash"] for row in (result.data or []))
+    return referenced
+
+
+def cleanup_unreferenced(min_age_minutes=60, dry_run=False):
+    """Delete content-addressed answer objects no answer row points at.
+
+    Objects modified less than min_age_minutes ago are kept so an upload
+    whose answer row has not been written yet is not removed underneath
+    it. Age is taken from updated_at, which the upsert in store_answer_file
+    bumps, so re-uploading an orphan restarts its grace period; created_at
+    is only a fallback. Candidates are also checked against answers again
+    right before removal. Legacy, non-hash object names are never touched.
+
+    One race remains: store_answer_file reuses an object without uploading
+    when find_stored sees a referencing row. If that row is replaced and
+    cleanup deletes the object before the new row is written, the new
+    answer points at a missing file.
+    """
+    if min_age_minutes < MIN_CLEANUP_AGE_MINUTES:
+        raise ValueError(f"min_age_minutes must be at least {MIN_CLEANUP_AGE_MINUTES}")
+
+    referenced = _referenced_hashes()
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=min_age_minutes)
+
+    candidates = []
+    for folder in (ANSWERS_FOLDER, THUMBNAILS_FOLDER, ORIGINALS_FOLDER):
+        for obj in _list_objects(folder):
+            name = obj.get("name", "")
+            match = _OBJECT_NAME_RE.match(name)
+            if not match or match.group(1) in referenced:
+                continue
+            modified_at = _parse_timestamp(obj.get("updated_at") or obj.get("created_at"))
+            if modified_at is None or modified_at > cutoff:
+                continue
+            candidates.append((f"{folder}/{name}", match.group(1)))
+
+    rereferenced = _still_referenced(sorted({file_hash for _, file_hash in candidates}))
+    orphans = [path for path, file_hash in candidates if file_hash not in rereferenced]
+
+    if orphans and not dry_run:
+        supabase_admin.storage.from_(BUCKET).remove(orphans)
+
+    return orphans
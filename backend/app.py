@@ -3,6 +3,7 @@ from flask import Flask, send_from_directory
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+# Load .env once, before any module reads configuration from os.environ
 load_dotenv()
 
 from admin_routes import admin_bp
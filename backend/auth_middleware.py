@@ -2,9 +2,6 @@ import os
 import jwt
 from functools import wraps
 from flask import request, jsonify, g
-from dotenv import load_dotenv
-
-load_dotenv()
 
 SUPABASE_JWT_SECRET = os.getenv("SUPABASE_KEY")
 
@@ -0,0 +1,81 @@
+"""Throughput benchmark for answer scan normalisation.
+
+Runs normalize_image over a set of images in a process pool and reports
+images per second per core and the bytes saved. Uses synthetic phone-sized
+photos unless a directory of real scans is given. Usage:
+
+    python bench_scans.py [--dir scans/] [--count 24] [--workers 4]
+"""
+import argparse
+import io
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from scan_processing import normalize_image
+
+
+def synthetic_scan(seed, size=(3024, 4032)):
+    """A noisy, photo-like JPEG roughly the size a phone camera produces."""
+    from PIL import Image, ImageDraw, ImageFilter
+
+    rng = random.Random(seed)
+    image = Image.effect_noise(size, 40).convert("RGB")
+    draw = ImageDraw.Draw(image)
+    for _ in range(200):
+        y = rng.randrange(size[1])
+        draw.line([(rng.randrange(200), y), (size[0] - rng.randrange(200), y)],
+                  fill=(20, 20, 60), width=6)
+    image = image.filter(ImageFilter.GaussianBlur(1))
+    out = io.BytesIO()
+    image.save(out, format="JPEG", quality=95)
+    return out.getvalue()
+
+
+def load_inputs(directory, count):
+    if directory:
+        inputs = []
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                with open(path, "rb") as f:
+                    inputs.append(f.read())
+        return inputs
+    return [synthetic_scan(i) for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dir", help="Directory of image files to process")
+    parser.add_argument("--count", type=int, default=24,
+                        help="Number of synthetic scans when --dir is not given")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    inputs = load_inputs(args.dir, args.count)
+    bytes_in = sum(len(b) for b in inputs)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        # Warm the workers so process start-up is not counted
+        list(pool.map(normalize_image, inputs[:args.workers]))
+        start = time.perf_counter()
+        outputs = list(pool.map(normalize_image, inputs))
+        elapsed = time.perf_counter() - start
+
+    bytes_scan = sum(len(scan) for scan, _ in outputs)
+    bytes_thumb = sum(len(thumb) for _, thumb in outputs)
+    per_sec = len(inputs) / elapsed
+
+    print(f"images:            {len(inputs)}")
+    print(f"workers:           {args.workers}")
+    print(f"throughput:        {per_sec:.1f} img/s ({per_sec / args.workers:.2f} img/s per core)")
+    print(f"input size:        {bytes_in / 1e6:.1f} MB")
+    print(f"normalised size:   {bytes_scan / 1e6:.1f} MB "
+          f"({100 * (1 - bytes_scan / bytes_in):.0f}% saved)")
+    print(f"thumbnails:        {bytes_thumb / 1e3:.0f} kB "
+          f"({bytes_thumb / len(inputs) / 1e3:.1f} kB each)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Cold-start benchmark for the API.
+
+Each run starts a fresh interpreter, imports app.py and serves one request
+through the Flask test client, which is roughly what a Vercel cold start
+does. It then times the first Supabase access separately, since every
+route except /api/health pays that cost on its first request. Usage:
+
+    python bench_startup.py [--runs 5] [--max-import-ms 500]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Runs inside the child interpreter and prints one JSON line. The first
+# Supabase-backed request pays for the SDK import and client construction,
+# so that is timed separately by building a query without sending it.
+# Placeholder credentials are used only when none are configured.
+CHILD_SCRIPT = """
+import json, os, sys, time
+t0 = time.perf_counter()
+from app import app
+t1 = time.perf_counter()
+resp = app.test_client().get("/api/health")
+t2 = time.perf_counter()
+supabase_loaded = "supabase" in sys.modules
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "bench.placeholder.key")
+from supabase_client import supabase_admin
+t3 = time.perf_counter()
+supabase_admin.table("exams").select("id")
+t4 = time.perf_counter()
+
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    "first_response_ms": (t2 - t1) * 1000,
+    "first_supabase_ms": (t4 - t3) * 1000,
+    "status": resp.status_code,
+    "supabase_loaded": supabase_loaded,
+}))
+"""
+
+
+def run_once():
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if out.returncode != 0:
+        sys.stderr.write(out.stderr)
+        sys.exit(f"FAIL: benchmark child exited with status {out.returncode}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=None,
+                        help="Exit non-zero if the median import time exceeds this")
+    args = parser.parse_args()
+
+    samples = [run_once() for _ in range(args.runs)]
+    import_ms = statistics.median(s["import_ms"] for s in samples)
+    first_ms = statistics.median(s["first_response_ms"] for s in samples)
+    supabase_ms = statistics.median(s["first_supabase_ms"] for s in samples)
+    eager = any(s["supabase_loaded"] for s in samples)
+    bad_status = sorted({s["status"] for s in samples if s["status"] != 200})
+
+    print(f"runs:                 {args.runs}")
+    print(f"import app (median):  {import_ms:.1f} ms")
+    print(f"first /api/health:    {first_ms:.1f} ms")
+    print(f"first Supabase use:   {supabase_ms:.1f} ms (SDK import + client, no network)")
+    print(f"cold start, health:   {import_ms + first_ms:.1f} ms")
+    print(f"cold start, Supabase: {import_ms + first_ms + supabase_ms:.1f} ms")
+    print(f"SDK loaded eagerly:   {'yes' if eager else 'no'}")
+
+    failed = False
+    if bad_status:
+        print(f"FAIL: /api/health returned {', '.join(map(str, bad_status))}")
+        failed = True
+    if eager:
+        print("FAIL: supabase SDK was imported before it was needed")
+        failed = True
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        print(f"FAIL: import time above {args.max_import_ms:.0f} ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
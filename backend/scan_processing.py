@@ -0,0 +1,138 @@
+import io
+import logging
+import os
+import threading
+
+# Uploaded answer scans are phone photos that are often 5-15 MB each. They
+# are downscaled and re-encoded as JPEG before storage, and a small thumbnail
+# is generated for the review list. The CPU work runs in a process pool so a
+# large upload does not hold the GIL for other requests. multiprocessing and
+# concurrent.futures are imported on first use to keep them off the
+# cold-start import path.
+
+SCAN_MAX_DIMENSION = int(os.getenv("SCAN_MAX_DIMENSION", "2000"))
+SCAN_JPEG_QUALITY = int(os.getenv("SCAN_JPEG_QUALITY", "80"))
+SCAN_THUMBNAIL_SIZE = int(os.getenv("SCAN_THUMBNAIL_SIZE", "320"))
+SCAN_KEEP_ORIGINAL = os.getenv("SCAN_KEEP_ORIGINAL", "false").lower() == "true"
+SCAN_WORKERS = int(os.getenv("SCAN_WORKERS", "0")) or None  # None = cpu count
+
+IMAGE_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp", "image/bmp", "image/tiff"}
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_unavailable = False
+_pool_lock = threading.Lock()
+
+
+def is_image(content_type):
+    return (content_type or "").lower() in IMAGE_CONTENT_TYPES
+
+
+def _encode_jpeg(image, max_dimension, quality):
+    image = image.copy()
+    image.thumbnail((max_dimension, max_dimension))
+    out = io.BytesIO()
+    image.save(out, format="JPEG", quality=quality, optimize=True, progressive=True)
+    return out.getvalue()
+
+
+def _flatten_to_rgb(image, Image):
+    """Convert to RGB, painting transparent areas white rather than black."""
+    if image.mode == "P" and "transparency" in image.info:
+        image = image.convert("RGBA")
+    if image.mode in ("RGBA", "LA", "PA"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    if image.mode != "RGB":
+        return image.convert("RGB")
+    return image
+
+
+def normalize_image(file_bytes, max_dimension=SCAN_MAX_DIMENSION,
+                    quality=SCAN_JPEG_QUALITY, thumbnail_size=SCAN_THUMBNAIL_SIZE):
+    """Return (scan_jpeg, thumbnail_jpeg) for an uploaded image.
+
+    Normally runs inside pool workers. Pillow is imported here rather than
+    at module level so it only loads in the web process when the pool is
+    unavailable and images are processed inline.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(file_bytes)) as image:
+        # Phone cameras store rotation in EXIF; apply it before dropping EXIF
+        image = ImageOps.exif_transpose(image)
+        image = _flatten_to_rgb(image, Image)
+        scan = _encode_jpeg(image, max_dimension, quality)
+        thumbnail = _encode_jpeg(image, thumbnail_size, quality)
+    return scan, thumbnail
+
+
+def _get_pool():
+    """Return the shared worker pool, or None if processes can't be used."""
+    global _pool, _pool_unavailable
+    if _pool is None and not _pool_unavailable:
+        with _pool_lock:
+            if _pool is None and not _pool_unavailable:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                try:
+                    # spawn, not fork: the web process is multi-threaded and
+                    # holds live HTTP client state that must not be copied
+                    _pool = ProcessPoolExecutor(
+                        max_workers=SCAN_WORKERS,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                except (OSError, NotImplementedError):
+                    # Some serverless runtimes have no /dev/shm for semaphores
+                    logger.warning("Scan worker pool unavailable; processing inline",
+                                   exc_info=True)
+                    _pool_unavailable = True
+    return _pool
+
+
+def _discard_pool(pool):
+    """Drop a broken pool so the next upload starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def process_scan(file_bytes, content_type):
+    """Normalise an uploaded answer file.
+
+    Returns (scan_bytes, scan_content_type, thumbnail_bytes). Files that are
+    not images, or images that cannot be processed, are returned unchanged
+    with no thumbnail.
+    """
+    if not is_image(content_type):
+        return file_bytes, content_type, None
+
+    from concurrent.futures.process import BrokenProcessPool
+
+    pool = _get_pool()
+    try:
+        if pool is None:
+            scan, thumbnail = normalize_image(file_bytes)
+        else:
+            scan, thumbnail = pool.submit(normalize_image, file_bytes).result()
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory on a huge image). Not retried,
+        # since the same upload would likely kill the next worker too.
+        logger.error("Scan worker pool broke; storing %d byte upload unprocessed",
+                     len(file_bytes))
+        _discard_pool(pool)
+        return file_bytes, content_type, None
+    except Exception:
+        logger.warning("Could not normalise %s upload; storing it unprocessed",
+                       content_type, exc_info=True)
+        return file_bytes, content_type, None
+
+    # Never store a "normalised" file that ended up larger than the upload
+    if len(scan) >= len(file_bytes):
+        return file_bytes, content_type, thumbnail
+    return scan, "image/jpeg", thumbnail
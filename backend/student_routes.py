@@ -1,11 +1,15 @@
 import os
 from flask import Blueprint, request, jsonify, g
-from werkzeug.utils import secure_filename
 from supabase_client import supabase_admin
+from answer_storage import store_answer_file
 from auth_middleware import student_required
 
 student_bp = Blueprint("student", __name__, url_prefix="/api/student")
 
+# Dashboard payloads are per user and change slowly; a short private cache
+# absorbs repeat loads and back/forward navigation.
+HOME_CACHE_HEADERS = {"Cache-Control": "private, max-age=30", "Vary": "Authorization"}
+
 
 @student_bp.route("/exams", methods=["GET"])
 @student_required
@@ -74,34 +78,30 @@ def submit_answer(exam_id):
         if not assignment.data:
             return jsonify({"error": "You are not assigned to this exam"}), 403
 
-        file_url = ""
-        answer_text = request.form.get("answer_text", "")
-
-        if "answer_file" in request.files:
-            file = request.files["answer_file"]
-            if file.filename:
-                filename = secure_filename(file.filename)
-                filepath = f"answers/{exam_id}_{g.user_id}_{filename}"
-                
-                # Upload to Supabase Storage 'exam-files' bucket
-                file_bytes = file.read()
-                res = supabase_admin.storage.from_("exam-files").upload(filepath, file_bytes)
-                
-                # Get public URL
-                file_url = supabase_admin.storage.from_("exam-files").get_public_url(filepath)
-
-        # Check if answer already exists (update it)
-        existing = supabase_admin.table("answers").select("id").eq(
-            "question_id", question_id
-        ).eq("student_id", g.user_id).execute()
+        # Looked up first so an unchanged resubmission can skip the upload
+        existing = supabase_admin.table("answers").select(
+            "id, answer_file_hash, answer_file_url, answer_thumbnail_url"
+        ).eq("question_id", question_id).eq("student_id", g.user_id).execute()
 
         answer_data = {
             "question_id": question_id,
             "student_id": g.user_id,
-            "answer_file_url": file_url,
-            "answer_text": answer_text,
+            "answer_file_url": "",
+            "answer_file_hash": "",
+            "answer_thumbnail_url": "",
+            "answer_text": request.form.get("answer_text", ""),
         }
 
+        if "answer_file" in request.files:
+            file = request.files["answer_file"]
+            if file.filename:
+                # Normalised and stored content-addressed in the 'exam-files' bucket
+                file_bytes = file.read()
+                answer_data.update(store_answer_file(
+                    file_bytes, file.mimetype,
+                    existing=existing.data[0] if existing.data else None,
+                ))
+
         if existing.data:
             result = supabase_admin.table("answers").update(answer_data).eq(
                 "id", existing.data[0]["id"]
@@ -152,3 +152,47 @@ def my_answers(exam_id):
         return jsonify(all_answers), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+
+@student_bp.route("/home", methods=["GET"])
+@student_required
+def home():
+    """Exams, progress and published results for the student dashboard."""
+    try:
+        # One joined query per table instead of the list_exams /
+        # my_answers / view_results waterfall. Answers are counted by the
+        # student_exam_progress view, so this reads one row per exam.
+        assignments = supabase_admin.table("exam_students").select(
+            "exams(*, profiles!exams_teacher_id_fkey(name), questions(count))"
+        ).eq("student_id", g.user_id).execute()
+
+        progress = supabase_admin.table("student_exam_progress").select(
+            "exam_id, answered_count"
+        ).eq("student_id", g.user_id).execute()
+
+        results = supabase_admin.table("results").select(
+            "*, exams(title, description)"
+        ).eq("student_id", g.user_id).eq("published", True).order(
+            "exam_id", desc=True
+        ).execute()
+
+        answered = {p["exam_id"]: p["answered_count"] for p in (progress.data or [])}
+
+        exams = []
+        for row in (assignments.data or []):
+            exam = row.get("exams")
+            if not exam:
+                continue
+            question_count = exam.pop("questions", [{}])
+            exam["question_count"] = question_count[0].get("count", 0) if question_count else 0
+            exam["answered_count"] = answered.get(exam["id"], 0)
+            exams.append(exam)
+
+        # Same order as list_exams: scheduled_start descending, unscheduled first
+        exams.sort(key=lambda e: (e["scheduled_start"] is None, e["scheduled_start"] or ""),
+                   reverse=True)
+
+        payload = {"exams": exams, "results": results.data or []}
+        return jsonify(payload), 200, HOME_CACHE_HEADERS
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
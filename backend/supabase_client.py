@@ -1,15 +1,35 @@
 import os
-from dotenv import load_dotenv
-from supabase import create_client, Client
+import threading
 
-load_dotenv()
+# The supabase SDK is heavy to import and each client opens its own HTTP
+# session, so both are built on first use rather than at import time. This
+# keeps serverless cold starts cheap for requests that never touch Supabase.
+
+
+class _LazyClient:
+    """Proxy that creates a Supabase client on first attribute access."""
+
+    def __init__(self, key_env):
+        self._key_env = key_env
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from supabase import create_client
+                    self._client = create_client(
+                        os.getenv("SUPABASE_URL"), os.getenv(self._key_env)
+                    )
+        return self._client
+
+    def __getattr__(self, name):
+        return getattr(self._get_client(), name)
 
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
 
 # Anon client — for standard operations
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+supabase = _LazyClient("SUPABASE_KEY")
 
 # Service-role client — bypasses RLS, used for admin operations
-supabase_admin: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+supabase_admin = _LazyClient("SUPABASE_SERVICE_KEY")
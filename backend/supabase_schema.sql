@@ -48,6 +48,8 @@ CREATE TABLE IF NOT EXISTS answers (
     question_id UUID REFERENCES questions(id) ON DELETE CASCADE,
     student_id UUID REFERENCES profiles(id) ON DELETE CASCADE,
     answer_file_url TEXT DEFAULT '',
+    answer_file_hash TEXT DEFAULT '',
+    answer_thumbnail_url TEXT DEFAULT '',
     answer_text TEXT DEFAULT '',
     obtained_marks INTEGER,
     feedback TEXT DEFAULT '',
@@ -55,6 +57,11 @@ CREATE TABLE IF NOT EXISTS answers (
     UNIQUE(question_id, student_id)
 );
 
+-- Existing deployments: add the content hash and thumbnail columns for answer files
+ALTER TABLE answers ADD COLUMN IF NOT EXISTS answer_file_hash TEXT DEFAULT '';
+ALTER TABLE answers ADD COLUMN IF NOT EXISTS answer_thumbnail_url TEXT DEFAULT '';
+CREATE INDEX IF NOT EXISTS answers_file_hash_idx ON answers(answer_file_hash);
+
 -- Results
 CREATE TABLE IF NOT EXISTS results (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -68,6 +75,30 @@ CREATE TABLE IF NOT EXISTS results (
     UNIQUE(exam_id, student_id)
 );
 
+-- Dashboard aggregates, so the home endpoints read one row per exam instead
+-- of every answer. security_invoker applies the callers' RLS policies.
+CREATE OR REPLACE VIEW student_exam_progress WITH (security_invoker = true) AS
+SELECT q.exam_id, a.student_id, COUNT(*) AS answered_count
+FROM answers a
+JOIN questions q ON q.id = a.question_id
+GROUP BY q.exam_id, a.student_id;
+
+CREATE OR REPLACE VIEW exam_stats WITH (security_invoker = true) AS
+SELECT
+    e.id AS exam_id,
+    e.teacher_id,
+    (SELECT COUNT(DISTINCT a.student_id) FROM answers a
+        JOIN questions q ON q.id = a.question_id
+        WHERE q.exam_id = e.id) AS submitted_count,
+    (SELECT COUNT(*) FROM answers a
+        JOIN questions q ON q.id = a.question_id
+        WHERE q.exam_id = e.id AND a.obtained_marks IS NULL) AS ungraded_count,
+    (SELECT COUNT(*) FROM results r
+        WHERE r.exam_id = e.id AND r.published) AS published_count,
+    (SELECT ROUND(AVG(r.percentage), 2) FROM results r
+        WHERE r.exam_id = e.id AND r.published) AS average_percentage
+FROM exams e;
+
 -- Enable Row Level Security (optional, since backend uses service role)
 ALTER TABLE profiles ENABLE ROW LEVEL SECURITY;
 ALTER TABLE exams ENABLE ROW LEVEL SECURITY;
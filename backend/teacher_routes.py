@@ -6,6 +6,8 @@ from auth_middleware import teacher_required
 
 teacher_bp = Blueprint("teacher", __name__, url_prefix="/api/teacher")
 
+HOME_CACHE_HEADERS = {"Cache-Control": "private, max-age=30", "Vary": "Authorization"}
+
 
 @teacher_bp.route("/students", methods=["GET"])
 @teacher_required
@@ -81,6 +83,41 @@ def list_exams():
         return jsonify({"error": str(e)}), 500
 
 
+@teacher_bp.route("/home", methods=["GET"])
+@teacher_required
+def home():
+    """Exams with assignment, submission and result counts for the dashboard."""
+    try:
+        exams = supabase_admin.table("exams").select(
+            "*, exam_students(count), questions(count)"
+        ).eq("teacher_id", g.user_id).order("created_at", desc=True).execute()
+
+        # Submission and result counts are aggregated by the exam_stats
+        # view, one row per exam, rather than by fetching every answer
+        stats = supabase_admin.table("exam_stats").select(
+            "exam_id, submitted_count, ungraded_count, published_count, average_percentage"
+        ).eq("teacher_id", g.user_id).execute()
+        stats_by_exam = {row["exam_id"]: row for row in (stats.data or [])}
+
+        exam_list = []
+        for exam in (exams.data or []):
+            students = exam.pop("exam_students", [{}])
+            questions = exam.pop("questions", [{}])
+            row = stats_by_exam.get(exam["id"], {})
+            average = row.get("average_percentage")
+            exam["student_count"] = students[0].get("count", 0) if students else 0
+            exam["question_count"] = questions[0].get("count", 0) if questions else 0
+            exam["submitted_count"] = row.get("submitted_count", 0)
+            exam["ungraded_count"] = row.get("ungraded_count", 0)
+            exam["published_count"] = row.get("published_count", 0)
+            exam["average_percentage"] = float(average) if average is not None else None
+            exam_list.append(exam)
+
+        return jsonify({"exams": exam_list}), 200, HOME_CACHE_HEADERS
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @teacher_bp.route("/exams", methods=["POST"])
 @teacher_required
 def create_exam():
@@ -43,7 +43,7 @@ export default function StudentDashboard() {
     const [loading, setLoading] = useState(true)
 
     useEffect(() => {
-        api.get('/student/exams').then(({ data }) => setExams(data)).catch(console.error).finally(() => setLoading(false))
+        api.get('/student/home').then(({ data }) => setExams(data.exams)).catch(console.error).finally(() => setLoading(false))
     }, [])
 
     const upcoming = exams.filter(e => e.status === 'scheduled' && e.scheduled_start && isFuture(new Date(e.scheduled_start)))
@@ -63,6 +63,7 @@ export default function StudentDashboard() {
             <div className="exam-meta">
                 <span><HiOutlineCalendar /> {exam.scheduled_start ? format(new Date(exam.scheduled_start), 'MMM dd, yyyy HH:mm') : '—'}</span>
                 <span><HiOutlineClock /> {exam.duration_minutes}min</span>
+                {exam.question_count > 0 && <span><HiOutlineClipboardList /> {exam.answered_count}/{exam.question_count} answered</span>}
             </div>
             {exam.profiles?.name && (
                 <p style={{ fontSize: '0.75rem', color: 'var(--text-muted)', marginTop: 8 }}>Teacher: {exam.profiles.name}</p>
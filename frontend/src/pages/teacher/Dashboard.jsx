@@ -17,7 +17,7 @@ export default function TeacherDashboard() {
     const [loading, setLoading] = useState(true)
 
     useEffect(() => {
-        api.get('/teacher/exams').then(({ data }) => setExams(data)).catch(console.error).finally(() => setLoading(false))
+        api.get('/teacher/home').then(({ data }) => setExams(data.exams)).catch(console.error).finally(() => setLoading(false))
     }, [])
 
     const stats = [
@@ -64,6 +64,8 @@ export default function TeacherDashboard() {
                             <div className="exam-meta">
                                 <span><HiOutlineCalendar /> {exam.scheduled_start ? format(new Date(exam.scheduled_start), 'MMM dd, yyyy HH:mm') : 'Not scheduled'}</span>
                                 <span><HiOutlineClock /> {exam.duration_minutes}min</span>
+                                <span><HiOutlineUsers /> {exam.submitted_count}/{exam.student_count} submitted</span>
+                                {exam.ungraded_count > 0 && <span>{exam.ungraded_count} to mark</span>}
                             </div>
                             <div className="exam-actions">
                                 <button className="btn btn-secondary btn-sm" onClick={() => navigate(`/teacher/exams/${exam.id}/answers`)}><HiOutlineEye /> Answers</button>
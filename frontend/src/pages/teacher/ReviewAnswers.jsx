@@ -84,6 +84,12 @@ export default function ReviewAnswers() {
                                     </div>
                                 )}
 
+                                {ans.answer_thumbnail_url && (
+                                    <a href={ans.answer_file_url} target="_blank" rel="noopener noreferrer" style={{ display: 'block', marginBottom: 'var(--space-md)' }}>
+                                        <img src={ans.answer_thumbnail_url} alt="Answer sheet preview" loading="lazy" style={{ maxWidth: 160, borderRadius: 'var(--radius-sm)', border: '1px solid var(--glass-border)' }} />
+                                    </a>
+                                )}
+
                                 {ans.answer_file_url && (
                                     <a href={ans.answer_file_url} target="_blank" rel="noopener noreferrer" className="btn btn-secondary btn-sm" style={{ marginBottom: 'var(--space-md)' }}>
                                         <HiOutlineDownload /> Download Answer File